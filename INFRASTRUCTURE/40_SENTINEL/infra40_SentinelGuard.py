@@ -4,7 +4,7 @@ PROJECT   : AOXC-V2-AKDENIZ - ABSOLUTE NOTARY (MUTLAK NOTER)
 OWNER     : AOXC DAO (Akdeniz Division)
 RESOURCES : https://github.com/aoxc/AOXCDAO
 CONTACT   : aoxcdao@gmail.com
-VERSION   : 8.4.0 "SUPREME STABLE"
+VERSION   : 9.0.0 "SUPREME STABLE"
 LICENSE   : Proprietary / AOXC Internal
 ---------------------------------------------------------------------------------
 Description:
@@ -13,16 +13,66 @@ Implements atomic sealing via SHA-256 and IPFS persistence.
 ---------------------------------------------------------------------------------
 """
 
+import argparse
+import asyncio
+import atexit
+import glob
+import io
 import json
 import time
 import os
 import subprocess
+import ssl
 import sys
 import hashlib
-import random
+import threading
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from eth_utils import to_checksum_address
 from web3 import Web3
 
+# --- [ CRYPTOGRAPHIC BACKEND ] ---
+# CPython links hashlib.sha256 to OpenSSL EVP_sha256, which selects the SHA-NI
+# (x86) or SHA2 (ARMv8) instruction path at runtime. Builds without OpenSSL
+# fall back to CPython's bundled (software-only) implementation.
+try:
+    import _hashlib
+    HASH_OPENSSL = hashlib.sha256 is _hashlib.openssl_sha256
+except (ImportError, AttributeError):
+    HASH_OPENSSL = False
+HASH_BACKEND = ssl.OPENSSL_VERSION if HASH_OPENSSL else "hashlib (builtin)"
+
+# --- [ SERIALIZATION BACKEND ] ---
+# orjson encodes natively to bytes; the stdlib fallback is tuned to emit the
+# identical byte stream (compact separators, raw UTF-8) so fingerprints match.
+try:
+    import orjson
+
+    def json_encode(obj, sort_keys=False, indent=False):
+        option = (orjson.OPT_SORT_KEYS if sort_keys else 0) | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+
+    json_decode = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:
+    def json_encode(obj, sort_keys=False, indent=False):
+        separators = (",", ": ") if indent else (",", ":")
+        return json.dumps(obj, sort_keys=sort_keys, indent=2 if indent else None,
+                          separators=separators, ensure_ascii=False).encode()
+
+    json_decode = json.loads
+    JSON_BACKEND = "json"
+
+# --- [ SEAL CANONICALIZATION ] ---
+# Recorded in every attestation so a verifier knows which byte form was hashed.
+# v1 (8.x, no "canonicalization" field): json.dumps(payload, sort_keys=True).
+# v2: the payload array as compact, sorted-keys, raw UTF-8 JSON (orjson form).
+SEAL_CANONICALIZATION = "v2:json-compact-sorted-utf8"
+
 # --- [ IDENTITY & PARTNER CONFIGURATION ] ---
 IDENTITY = {
     "TAG": "AOXC-V2-AKDENIZ-SUPREME-NOTARY",
@@ -33,11 +83,28 @@ IDENTITY = {
     "MUSEUM_TAG": "AOXC-PRIME-ARTIFACT"
 }
 
+GATEWAY_HEADERS = {
+    'User-Agent': f"{IDENTITY['TAG']}/{IDENTITY['ORG']} Partner-Integrator ({IDENTITY['X']})",
+    'Content-Type': 'application/json'
+}
+
 # --- [ NETWORK PARAMETERS ] ---
 RPC_NODES     = ["https://xlayer.drpc.org", "https://rpc.xlayer.okx.com"]
+WS_NODES      = ["wss://xlayer.drpc.org", "wss://xlayerws.okx.com"]
 GENESIS_BLOCK = 52084000
 BLOCK_STEP    = 70       # Optimized for low-latency & low-impact scanning
-THROTTLE_TIME = 0.12     # Industrial cooling period between calls
+RPC_RATE      = 8        # Sustained eth_getLogs calls per second, batched or not (partner compliance)
+RPC_BURST     = 16       # Calls allowed back-to-back while the gateway is responsive
+SCAN_WORKERS  = 8        # Concurrent RPC requests in flight
+SCAN_AHEAD    = 2 * SCAN_WORKERS  # Batches fetched but not yet committed, at most
+RPC_BATCH     = 10       # get_logs windows packed into one JSON-RPC batch
+RPC_TIMEOUT   = 30
+RPC_RETRIES   = 3        # Attempts per batch while the gateway throttles (429) or errors (5xx)
+RPC_BACKOFF   = 2        # Seconds before the first retry, doubling per attempt
+RPC_POOL_SIZE = 16       # Keep-alive connections per gateway host
+CYCLE_INTERVAL = 60      # Daemon mode: seconds between notary cycles
+LIVE_SEAL_EVERY    = 500 # Live mode: seal once this many logs are buffered...
+LIVE_SEAL_INTERVAL = 300 # ...or this many seconds have passed, whichever is first
 
 # --- [ TARGET ASSETS ] ---
 TARGETS = [
@@ -45,6 +112,8 @@ TARGETS = [
     "0x97Bdd1fD1CAF756e00eFD42eBa9406821465B365",
     "0x20c0DD8B6559912acfAC2ce061B8d5b19Db8CA84"
 ]
+CHECKSUM_TARGETS = tuple(to_checksum_address(t) for t in TARGETS)
+CHECKSUM_LOOKUP  = {t.lower(): t for t in CHECKSUM_TARGETS}
 
 # --- [ FILESYSTEM PERSISTENCE ] ---
 BASE_DIR      = os.path.dirname(os.path.abspath(__file__))
@@ -52,8 +121,115 @@ PATHS = {
     "CURSOR": os.path.join(BASE_DIR, "LAST_SCANNED_BLOCK"),
     "SNAPSHOTS": os.path.join(BASE_DIR, "snapshots"),
     "LOGS": os.path.join(BASE_DIR, "logs"),
-    "IPFS_BIN": "/mnt/xdbx/ipfs/aoxc-prime"
+    "IPFS_BIN": "/mnt/xdbx/ipfs/aoxc-prime",
+    "IPFS_FILESTORE": "/mnt/xdbx"  # Filestore root of the IPFS node (--nocopy scope)
 }
+CURSOR_FLUSH_EVERY = 50  # Committed windows between durable cursor writes
+SPOOL_BUFFER  = 1 << 20  # Write buffer for the vault spool and certificates
+CURSOR_STATE = {"pointer": None, "pending": 0}
+
+def fsync_directory(path):
+    """
+    Flushes directory metadata so a completed rename survives power loss.
+    """
+    dir_fd = os.open(path, os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+def write_all(fd, data):
+    """
+    Writes a whole buffer to a descriptor, resuming after short writes.
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def atomic_write(path, data):
+    """
+    Durably replaces a file: write a sibling temp file, fsync, rename over,
+    then fsync the parent directory. Readers see the old or new file, never a torn one.
+    `data` is bytes or an iterable of byte chunks, coalesced into SPOOL_BUFFER writes.
+    """
+    chunks = (data,) if isinstance(data, (bytes, bytearray)) else data
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        pending = bytearray()
+        for chunk in chunks:
+            pending += chunk
+            if len(pending) >= SPOOL_BUFFER:
+                write_all(fd, pending)
+                pending = bytearray()
+        write_all(fd, pending)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+    fsync_directory(os.path.dirname(path))
+
+def flush_cursor(sync=None):
+    """
+    Persists the in-memory scan cursor if it moved since the last flush.
+    `sync` makes the data behind the cursor durable first, so the persisted
+    cursor never points past logs that could still be lost.
+    """
+    if CURSOR_STATE["pending"]:
+        if sync is not None:
+            sync()
+        atomic_write(PATHS["CURSOR"], str(CURSOR_STATE["pointer"]).encode())
+        CURSOR_STATE["pending"] = 0
+
+def advance_cursor(pointer, sync=None):
+    """
+    Moves the scan cursor in memory; it reaches disk every CURSOR_FLUSH_EVERY
+    windows, on exit and on failure (a crash replays at most that many windows).
+    """
+    CURSOR_STATE["pointer"] = pointer
+    CURSOR_STATE["pending"] += 1
+    if CURSOR_STATE["pending"] >= CURSOR_FLUSH_EVERY:
+        flush_cursor(sync)
+
+atexit.register(flush_cursor)
+
+def cpu_supports_sha_extensions():
+    """
+    Reports whether the CPU advertises SHA-256 instructions, going by the
+    sha_ni (x86) / sha2 (ARM) flags the kernel lists in /proc/cpuinfo.
+    """
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                if line.startswith(("flags", "Features")):
+                    return bool({"sha_ni", "sha2"} & set(line.split()))
+    except OSError:
+        pass
+    return False
+
+SHA_EXTENSIONS = cpu_supports_sha_extensions()
+# The instructions only serve the seals when OpenSSL is doing the hashing
+SHA_ACCELERATED = HASH_OPENSSL and SHA_EXTENSIONS
+
+def sha256_stream():
+    """
+    Opens an incremental SHA-256 context on the hashlib (OpenSSL) backend.
+    """
+    return hashlib.sha256()
+
+def sha256_seal(h):
+    """
+    Finalizes a sha256_stream() context, returning the digest as uppercase hex.
+    """
+    return h.hexdigest().upper()
+
+def sha256_hw(buf):
+    """
+    Hardware-accelerated SHA-256 digest of a byte buffer, as uppercase hex.
+    """
+    h = sha256_stream()
+    h.update(buf)
+    return sha256_seal(h)
 
 def initialize_industrial_structure():
     """
@@ -63,114 +239,776 @@ def initialize_industrial_structure():
         os.makedirs(folder, exist_ok=True)
     
     if not os.path.exists(PATHS["CURSOR"]):
-        with open(PATHS["CURSOR"], "w") as f:
-            f.write(str(GENESIS_BLOCK))
+        atomic_write(PATHS["CURSOR"], str(GENESIS_BLOCK).encode())
+
+def build_gateway_session():
+    """
+    Creates the pooled keep-alive HTTP session shared by Web3 and batch RPC,
+    so TCP + TLS handshakes are paid once per connection, not once per call.
+    """
+    session = requests.Session()
+    session.headers.update(GATEWAY_HEADERS)
+    adapter = HTTPAdapter(pool_connections=RPC_POOL_SIZE, pool_maxsize=RPC_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+GATEWAY_SESSION = build_gateway_session()
+
+PROVIDER_STATE = {"w3": None, "failed": None}
+
+class GatewayUnavailable(ConnectionError):
+    """
+    Raised when no RPC gateway answers a probe round.
+    """
 
 def get_supreme_provider():
     """
     Establishes a transparent, identified connection with the RPC gateway.
     Declares AOXC Partner identity via HTTP headers.
+    A gateway that recently dropped a call is probed last.
     """
-    identity_header = {
-        'User-Agent': f"{IDENTITY['TAG']}/{IDENTITY['ORG']} Partner-Integrator ({IDENTITY['X']})",
-        'Content-Type': 'application/json'
-    }
-    
-    for url in RPC_NODES:
+    for url in sorted(RPC_NODES, key=lambda node: node == PROVIDER_STATE["failed"]):
         try:
-            w3 = Web3(Web3.HTTPProvider(url, request_kwargs={'headers': identity_header, 'timeout': 30}))
+            w3 = Web3(Web3.HTTPProvider(url, request_kwargs={'headers': GATEWAY_HEADERS, 'timeout': RPC_TIMEOUT},
+                                        session=GATEWAY_SESSION))
             if w3.is_connected():
                 return w3
         except Exception:
             continue
-    sys.exit(f"\n[!] CRITICAL: All gateway nodes are unreachable for {IDENTITY['ORG']}.")
+    raise GatewayUnavailable(f"All gateway nodes are unreachable for {IDENTITY['ORG']}.")
 
-def seal_artifact(payload, start_block, end_block):
+def get_provider_cached():
+    """
+    Reuses the connected gateway across cycles; re-probes only once it stops answering.
+    """
+    w3 = PROVIDER_STATE["w3"]
+    if w3 is not None and w3.is_connected():
+        return w3
+    w3 = get_supreme_provider()
+    PROVIDER_STATE["w3"] = w3
+    # A different gateway may accept batches the previous one refused
+    BATCH_STATE["enabled"] = True
+    return w3
+
+def invalidate_provider():
+    """
+    Drops the cached gateway after a connection failure so the next cycle fails over.
+    """
+    w3 = PROVIDER_STATE["w3"]
+    if w3 is not None:
+        PROVIDER_STATE["failed"] = w3.provider.endpoint_uri
+    PROVIDER_STATE["w3"] = None
+
+class ArtifactVault:
+    """
+    Collects notarized logs and streams their canonical encoding into SHA-256
+    as they arrive, so sealing never materializes the full manifest.
+    Entries are spilled, one canonical JSON line each, to `spool` (an on-disk
+    file for ranged scans, memory by default) and spliced into the certificate.
+    The fingerprint equals sha256_hw(json_encode(logs, sort_keys=True)).
+    """
+
+    def __init__(self, spool=None, path=None):
+        self.spool = spool if spool is not None else io.BytesIO()
+        self.path = path
+        self.count = 0
+        self.hasher = sha256_stream()
+        self.hasher.update(b"[")
+        self.digest = None
+
+    def __len__(self):
+        return self.count
+
+    def add(self, entry):
+        self.add_encoded(json_encode(entry, sort_keys=True))
+
+    def add_encoded(self, encoded):
+        if self.count:
+            self.hasher.update(b",")
+        self.hasher.update(encoded)
+        self.spool.write(encoded)
+        self.spool.write(b"\n")
+        self.count += 1
+
+    def sync(self):
+        self.spool.flush()
+        try:
+            os.fsync(self.spool.fileno())
+        except io.UnsupportedOperation:
+            pass
+
+    def payload(self):
+        """
+        Streams the spooled canonical entries back in insertion order.
+        """
+        self.spool.flush()
+        self.spool.seek(0)
+        for line in self.spool:
+            yield line.rstrip(b"\n")
+
+    def discard(self):
+        self.spool.close()
+        if self.path is not None:
+            for leftover in (self.path, sealing_marker(self.path)):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+
+    def fingerprint(self):
+        if self.digest is None:
+            self.hasher.update(b"]")
+            self.digest = sha256_seal(self.hasher)
+        return self.digest
+
+def seal_artifact(vault, start_block, end_block):
     """
     Performs atomic SHA-256 sealing and metadata embedding for IPFS distribution.
+    Returns the certificate as a stream of byte chunks and the vault fingerprint.
     """
-    manifest_str = json.dumps(payload, sort_keys=True)
-    atomic_hash = hashlib.sha256(manifest_str.encode()).hexdigest().upper()
+    atomic_hash = vault.fingerprint()
     
-    certificate = {
-        "attestation": {
-            "fingerprint": atomic_hash,
-            "notary_seal": IDENTITY["TAG"],
-            "authority": IDENTITY["ORG"],
-            "repository": IDENTITY["GITHUB"],
-            "contact": IDENTITY["CONTACT"],
-            "timestamp": datetime.utcnow().isoformat(),
-            "range": f"{start_block}-{end_block}"
-        },
-        "payload": payload
+    attestation = {
+        "fingerprint": atomic_hash,
+        "canonicalization": SEAL_CANONICALIZATION,
+        "notary_seal": IDENTITY["TAG"],
+        "authority": IDENTITY["ORG"],
+        "repository": IDENTITY["GITHUB"],
+        "contact": IDENTITY["CONTACT"],
+        "timestamp": datetime.utcnow().isoformat(),
+        "range": f"{start_block}-{end_block}"
     }
+
+    def certificate():
+        # The payload reuses the canonical bytes already hashed: one encode per log
+        yield b'{\n"attestation": ' + json_encode(attestation, indent=True) + b',\n"payload": [\n'
+        separator = b""
+        for line in vault.payload():
+            yield separator
+            yield line
+            separator = b",\n"
+        yield b"\n]\n}\n"
     
-    return certificate, atomic_hash
+    return certificate(), atomic_hash
+
+def spool_path(start_block):
+    return os.path.join(PATHS["LOGS"], f"VAULT_SPOOL_{start_block}.jsonl")
+
+def sealing_marker(path):
+    # Durably names the certificate a spool is being sealed into
+    return path + ".sealing"
+
+def retire_sealed_spools():
+    """
+    Removes spools whose certificate was written before a crash kept the cycle
+    from discarding them, so their logs are never notarized twice. A marker
+    whose certificate never landed is dropped and its spool resumed as usual.
+    """
+    for marker in glob.glob(sealing_marker(spool_path("*"))):
+        with open(marker, "rb") as f:
+            certificate = f.read().decode()
+        path = marker[:-len(".sealing")]
+        if os.path.exists(certificate) and os.path.exists(path):
+            os.remove(path)
+            print(f"[*] SPOOL RETIRED  : already sealed in {os.path.basename(certificate)}")
+        os.remove(marker)
+        fsync_directory(PATHS["LOGS"])
+
+def open_vault_spool(cursor):
+    """
+    Opens the disk-backed vault for a ranged cycle, keeping RAM near one window.
+    A spool left by an interrupted cycle is resumed: its logs below the
+    persisted cursor will not be scanned again, so they are carried over and
+    the seal keeps the original start block. Returns (vault, start_block).
+    """
+    retire_sealed_spools()
+    leftovers = glob.glob(spool_path("*"))
+    starts = [int(os.path.basename(p)[len("VAULT_SPOOL_"):-len(".jsonl")]) for p in leftovers]
+    start_block = min(starts + [cursor])
+
+    path = spool_path(start_block)
+    spool = open(path + ".tmp", "w+b", buffering=SPOOL_BUFFER)
+    vault = ArtifactVault(spool, path)
+    for _, old_path in sorted(zip(starts, leftovers)):
+        with open(old_path, "rb") as f:
+            for line in f:
+                try:
+                    block_number = json_decode(line)["blockNumber"]
+                except ValueError:
+                    break  # torn tail of a crashed write
+                if block_number < cursor:
+                    vault.add_encoded(line.rstrip(b"\n"))
+
+    vault.sync()
+    os.replace(path + ".tmp", path)
+    for old_path in leftovers:
+        if old_path != path:
+            os.remove(old_path)
+    fsync_directory(PATHS["LOGS"])
+
+    if leftovers:
+        print(f"[*] SPOOL RESUMED  : {len(vault)} Artifacts from interrupted cycle @ {start_block}")
+    return vault, start_block
+
+def canonical_order(entries):
+    """
+    Sorts logs by chain position (block, transaction, log index) and drops
+    duplicates, so the sealed order never depends on how a gateway replied.
+    """
+    unique = {}
+    for entry in entries:
+        position = (entry["blockNumber"], entry["transactionIndex"], entry["logIndex"], entry.get("blockHash") or "")
+        unique.setdefault(position, entry)
+    return [unique[position] for position in sorted(unique)]
+
+def plan_scan_windows(start_block, end_block):
+    """
+    Splits the sync range into inclusive (from, to) windows of BLOCK_STEP blocks.
+    """
+    windows = []
+    pointer = start_block
+    while pointer < end_block:
+        limit = min(pointer + BLOCK_STEP, end_block)
+        windows.append((pointer, limit))
+        pointer = limit + 1
+    return windows
+
+# --- [ RATE LIMITING ] ---
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by every scan worker: bursts up to `burst`
+    calls, then sustains `rate` calls per second. A batch POST acquires one
+    token per call it carries.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, count=1):
+        while count > 0:
+            # The bucket never holds more than `burst`, so take large counts in slices
+            want = min(count, self.burst)
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= want:
+                    self.tokens -= want
+                    count -= want
+                    continue
+                wait = (want - self.tokens) / self.rate
+            time.sleep(wait)
+
+RPC_LIMITER = RateLimiter(RPC_RATE, RPC_BURST)
+
+# --- [ BATCH RPC ] ---
+RPC_LOG_QUANTITIES = ("blockNumber", "transactionIndex", "logIndex")
+BATCH_FALLBACKS = {}
+BATCH_STATE = {"enabled": True}
+BATCH_LOCK = threading.Lock()
+BATCH_TRANSIENT_STATUS = (429, 500, 502, 503, 504)
+
+def record_batch_fallback(reason, pin=True):
+    """
+    Counts a batch that degraded to single calls. A real refusal (pin=True)
+    pins the session to single-call mode; other failures only affect that batch.
+    """
+    with BATCH_LOCK:
+        BATCH_FALLBACKS[reason] = BATCH_FALLBACKS.get(reason, 0) + 1
+        if pin and BATCH_STATE["enabled"]:
+            print(f"[WARN] Batch RPC refused ({reason}). Falling back to single calls.", flush=True)
+            BATCH_STATE["enabled"] = False
+
+def is_batch_refusal(reply):
+    """
+    Recognizes the per-call JSON-RPC error a gateway returns for batches it
+    does not support, as opposed to an error about the call itself.
+    """
+    error = reply.get("error") if isinstance(reply, dict) else None
+    return isinstance(error, dict) and "batch" in str(error.get("message", "")).lower()
+
+def post_batch(url, batch):
+    """
+    POSTs a JSON-RPC batch, backing off while the gateway throttles or errors.
+    Raises requests.HTTPError once RPC_RETRIES attempts are exhausted.
+    """
+    body = json_encode(batch)
+    for attempt in range(RPC_RETRIES):
+        RPC_LIMITER.acquire(len(batch))
+        response = GATEWAY_SESSION.post(url, data=body, timeout=RPC_TIMEOUT)
+        if response.status_code not in BATCH_TRANSIENT_STATUS:
+            return response
+        if attempt == RPC_RETRIES - 1:
+            break
+        retry_after = response.headers.get("Retry-After", "")
+        delay = int(retry_after) if retry_after.isdigit() else RPC_BACKOFF * 2 ** attempt
+        print(f"[WARN] Gateway answered HTTP {response.status_code}; backing off {delay}s.", flush=True)
+        time.sleep(delay)
+    raise requests.HTTPError(f"HTTP {response.status_code} after {RPC_RETRIES} attempts", response=response)
+
+def normalize_rpc_log(raw):
+    """
+    Applies the Web3 log formatting to a raw eth_getLogs entry, so batched and
+    single-call logs serialize identically.
+    """
+    entry = dict(raw)
+    for key in RPC_LOG_QUANTITIES:
+        if isinstance(entry.get(key), str):
+            entry[key] = int(entry[key], 16)
+    # Logs can only come from TARGETS, so the keccak checksum is a table lookup
+    address = entry["address"]
+    entry["address"] = CHECKSUM_LOOKUP.get(address.lower()) or to_checksum_address(address)
+    return entry
+
+def log_to_dict(value):
+    """
+    Converts a Web3 log (AttributeDict / HexBytes tree) into the plain dict that
+    Web3.to_json would emit, without the JSON encode/decode round-trip.
+    """
+    if isinstance(value, Mapping):
+        return {key: log_to_dict(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [log_to_dict(item) for item in value]
+    if isinstance(value, (bytes, bytearray)):
+        # bytes.hex() is prefix-free across every hexbytes release
+        return "0x" + bytes.hex(value)
+    return value
+
+def logs_to_dicts(logs):
+    """
+    Bulk log_to_dict specialised for the flat eth_getLogs schema: hex-encodes
+    HexBytes fields and topics inline, deferring only unexpected shapes to
+    the generic walker.
+    """
+    to_hex = bytes.hex
+    converted = []
+    for log in logs:
+        entry = {}
+        for key, value in log.items():
+            if isinstance(value, bytes):
+                entry[key] = "0x" + to_hex(value)
+            elif key == "topics":
+                entry[key] = ["0x" + to_hex(t) if isinstance(t, bytes) else log_to_dict(t) for t in value]
+            elif value is None or isinstance(value, (str, int)):
+                entry[key] = value
+            else:
+                entry[key] = log_to_dict(value)
+        converted.append(entry)
+    return converted
+
+def fetch_window(w3, from_block, to_block, targets):
+    """
+    Retrieves the logs of a single scan window.
+    """
+    RPC_LIMITER.acquire()
+    logs = w3.eth.get_logs({'fromBlock': from_block, 'toBlock': to_block, 'address': targets})
+    return logs_to_dicts(logs)
+
+def fetch_window_batch(w3, windows, targets):
+    """
+    Retrieves several scan windows in one JSON-RPC batch POST.
+    Returns {from_block: [log, ...]}; refused batches degrade to single calls.
+    """
+    results = {}
+    if BATCH_STATE["enabled"] and len(windows) > 1:
+        batch = [
+            {"jsonrpc": "2.0", "id": i, "method": "eth_getLogs",
+             "params": [{"fromBlock": hex(from_block), "toBlock": hex(to_block), "address": targets}]}
+            for i, (from_block, to_block) in enumerate(windows)
+        ]
+        try:
+            response = post_batch(w3.provider.endpoint_uri, batch)
+            if response.status_code == 413:
+                record_batch_fallback("HTTP 413")
+            elif response.status_code != 200:
+                record_batch_fallback(f"HTTP {response.status_code}", pin=False)
+            else:
+                replies = json_decode(response.content)
+                if not isinstance(replies, list):
+                    record_batch_fallback("non-batch reply")
+                elif replies and all(is_batch_refusal(reply) for reply in replies):
+                    record_batch_fallback("batch not supported")
+                else:
+                    for reply in replies:
+                        if "result" in reply and isinstance(reply.get("id"), int) and reply["id"] < len(windows):
+                            results[windows[reply["id"]][0]] = [normalize_rpc_log(log) for log in reply["result"]]
+        except (requests.ConnectionError, requests.Timeout, requests.HTTPError):
+            # A dead or throttling gateway is not a batch refusal: fail the cycle
+            # instead of firing single calls at it, and keep batching for the retry
+            raise
+        except (requests.RequestException, ValueError) as e:
+            record_batch_fallback(type(e).__name__, pin=False)
+
+    # Windows the batch did not answer (errors, refusal) are retried one by one
+    for from_block, to_block in windows:
+        if from_block not in results:
+            results[from_block] = fetch_window(w3, from_block, to_block, targets)
+    return results
+
+# --- [ IPFS DISTRIBUTION ] ---
+# CIDv1 raw leaves in 1 MiB chunks keep DAG overhead low for sealed blobs.
+IPFS_ADD_ARGS = ["add", "-Q", "--progress=false", "--cid-version=1", "--raw-leaves",
+                 "--chunker=size-1048576"]
+
+def ipfs_add_args(path):
+    """
+    Adds --nocopy (reference the file in place instead of copying it into the
+    IPFS repo) only when the artifact lives under the node's filestore root.
+    """
+    root = os.path.realpath(PATHS["IPFS_FILESTORE"])
+    if os.path.commonpath([root, os.path.realpath(path)]) == root:
+        return IPFS_ADD_ARGS + ["--nocopy"]
+    return IPFS_ADD_ARGS
+
+def resolve_ipfs_binary():
+    """
+    Prefers the AOXC-provisioned IPFS binary, falling back to `ipfs` on PATH.
+    """
+    # X_OK alone also accepts a directory (e.g. an IPFS repo path)
+    if os.path.isfile(PATHS["IPFS_BIN"]) and os.access(PATHS["IPFS_BIN"], os.X_OK):
+        return PATHS["IPFS_BIN"]
+    return "ipfs"
+
+class IpfsDispatcher:
+    """
+    Publishes sealed artifacts with `ipfs add` in the background, so IPFS I/O
+    overlaps the next scan instead of blocking the notary.
+    A poller thread reports CIDs as jobs finish; drain() waits for the rest.
+    """
+    POLL_INTERVAL = 0.5
+
+    def __init__(self):
+        self.jobs = []
+        self.lock = threading.Lock()
+        self.poller = None
+
+    def submit(self, path, args=None):
+        if args is None:
+            args = ipfs_add_args(path)
+        try:
+            proc = subprocess.Popen(
+                [resolve_ipfs_binary(), *args, path],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+        except OSError as e:
+            print(f"[WARN] IPFS publish unavailable: {e}")
+            return
+        with self.lock:
+            self.jobs.append((path, proc, args))
+            if self.poller is None or not self.poller.is_alive():
+                self.poller = threading.Thread(target=self.poll, daemon=True)
+                self.poller.start()
+
+    def poll(self):
+        while True:
+            self.reap()
+            with self.lock:
+                if not self.jobs:
+                    self.poller = None
+                    return
+            time.sleep(self.POLL_INTERVAL)
+
+    def reap(self, block=False):
+        """
+        Reports finished jobs, or waits on every pending job when block=True.
+        """
+        with self.lock:
+            finished = [job for job in self.jobs if block or job[1].poll() is not None]
+            self.jobs = [job for job in self.jobs if job not in finished]
+
+        for path, proc, args in finished:
+            out, err = proc.communicate()
+            name = os.path.basename(path)
+            if proc.returncode == 0:
+                print(f"[+] IPFS PINNED    : {out.decode().strip()} ({name})", flush=True)
+            elif "--nocopy" in args:
+                # Filestore disabled or path outside its root: copy into the repo instead
+                print(f"[WARN] IPFS filestore refused {name}; retrying with a full copy.", flush=True)
+                self.submit(path, [arg for arg in args if arg != "--nocopy"])
+            else:
+                print(f"[WARN] IPFS publish failed for {name}: {err.decode().strip()}", flush=True)
+
+    def drain(self):
+        # Reaping may resubmit (filestore fallback), so wait until nothing is left
+        while True:
+            self.reap(block=True)
+            with self.lock:
+                if not self.jobs:
+                    return
+
+IPFS_DISPATCHER = IpfsDispatcher()
+atexit.register(IPFS_DISPATCHER.drain)
+
+def read_cursor():
+    """
+    Loads the persisted scan cursor (next block to notarize).
+    """
+    with open(PATHS["CURSOR"], "r") as f:
+        return int(f.read().strip())
+
+def publish_vault(vault, start_block, end_block):
+    """
+    Seals a vault, persists the certificate and queues it for IPFS distribution.
+    """
+    # Execution of the Sealing Ritual
+    certificate, final_hash = seal_artifact(vault, start_block, end_block)
+
+    # Save to Artifact Vault
+    file_name = f"AOXC_CERT_{int(time.time())}_{final_hash[:8]}.json"
+    full_path = os.path.join(PATHS["SNAPSHOTS"], file_name)
+
+    # The marker lands before the certificate: after a crash, an existing
+    # certificate proves the spool was sealed (see retire_sealed_spools)
+    if vault.path is not None:
+        atomic_write(sealing_marker(vault.path), full_path.encode())
+    atomic_write(full_path, certificate)
+
+    print(f"\n[+] SEALING COMPLETE: {final_hash}")
+    print(f"[+] ARTIFACT SAVED : {file_name}")
+    IPFS_DISPATCHER.submit(full_path)
 
 def run_notary_cycle():
     """
     Core execution loop for the AOXC Supreme Notary.
     Ensures data integrity with minimal network footprint.
+    Raises GatewayUnavailable when no gateway answers the probe round.
     """
     initialize_industrial_structure()
-    w3 = get_supreme_provider()
-    
-    with open(PATHS["CURSOR"], "r") as f:
-        cursor = int(f.read().strip())
-    
-    current_head = w3.eth.block_number
-    checksum_targets = [w3.to_checksum_address(t) for t in TARGETS]
+    IPFS_DISPATCHER.reap()
+    w3 = get_provider_cached()
+    vault = None
 
-    print(f"\n{'#'*80}")
-    print(f" AOXC SUPREME NOTARY | ACTIVE SESSION")
-    print(f" NODE ADDRESS   : {w3.provider.endpoint_uri}")
-    print(f" TARGET SCOPE   : {len(TARGETS)} Contracts")
-    print(f" SYNC RANGE     : {cursor} -> {current_head}")
-    print(f"{'#'*80}\n")
+    try:
+        cursor = read_cursor()
+        current_head = w3.eth.block_number
+        sha_ext = "ACTIVE" if SHA_ACCELERATED else "UNUSED" if SHA_EXTENSIONS else "ABSENT"
 
-    vault = []
-    pointer = cursor
+        print(f"\n{'#'*80}")
+        print(f" AOXC SUPREME NOTARY | ACTIVE SESSION")
+        print(f" NODE ADDRESS   : {w3.provider.endpoint_uri}")
+        print(f" TARGET SCOPE   : {len(TARGETS)} Contracts")
+        print(f" SYNC RANGE     : {cursor} -> {current_head}")
+        print(f" HASH BACKEND   : {HASH_BACKEND} | SHA-EXT: {sha_ext}")
+        print(f" JSON BACKEND   : {JSON_BACKEND}")
+        print(f"{'#'*80}\n")
 
-    try:
-        while pointer < current_head:
-            limit = min(pointer + BLOCK_STEP, current_head)
-            
-            # High-efficiency log retrieval
-            logs = w3.eth.get_logs({'fromBlock': pointer, 'toBlock': limit, 'address': checksum_targets})
-            
-            for log in logs:
-                vault.append(json.loads(Web3.to_json(log)))
-
-            # Progress Tracking
-            print(f"[PROGRESS] {pointer} -> {limit} | Artifacts Secured: {len(vault)}", flush=True)
-            
-            # Atomic state save
-            pointer = limit + 1
-            with open(PATHS["CURSOR"], "w") as f:
-                f.write(str(pointer))
-            
-            # Industrial Throttling (Partner Compliance)
-            time.sleep(THROTTLE_TIME + random.uniform(0, 0.05))
+        vault, start_block = open_vault_spool(cursor)
+        windows = plan_scan_windows(cursor, current_head)
+        batches = [windows[i:i + RPC_BATCH] for i in range(0, len(windows), RPC_BATCH)]
+
+        # Windows are fetched concurrently but committed strictly in order:
+        # the cursor only advances past a window once every earlier one landed.
+        pool = ThreadPoolExecutor(max_workers=SCAN_WORKERS)
+        try:
+            # Batches are submitted lazily, at most SCAN_AHEAD past the commit
+            # point, so fetched logs in memory stay bounded whatever the gap size.
+            in_flight = set()
+            submitted = 0
+            landed = {}
+            committed = 0
+
+            while committed < len(windows):
+                while submitted < len(batches) and submitted - committed // RPC_BATCH < SCAN_AHEAD:
+                    in_flight.add(pool.submit(fetch_window_batch, w3, batches[submitted], CHECKSUM_TARGETS))
+                    submitted += 1
+
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    landed.update(future.result())
+                del done, future
+
+                while committed < len(windows) and windows[committed][0] in landed:
+                    from_block, to_block = windows[committed]
+                    # Windows are disjoint and ascending, so per-window order is global order
+                    for entry in canonical_order(landed.pop(from_block)):
+                        vault.add(entry)
+
+                    # Progress Tracking
+                    print(f"[PROGRESS] {from_block} -> {to_block} | Artifacts Secured: {len(vault)}", flush=True)
+
+                    # Buffered state save
+                    advance_cursor(to_block + 1, vault.sync)
+                    committed += 1
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            flush_cursor(vault.sync)
 
         if not vault:
+            vault.discard()
             print("[*] No new data identified. Standing by for next block cycle.")
             return
 
-        # Execution of the Sealing Ritual
-        certificate, final_hash = seal_artifact(vault, cursor, current_head)
-        
-        # Save to Artifact Vault
-        file_name = f"AOXC_CERT_{int(time.time())}_{final_hash[:8]}.json"
-        full_path = os.path.join(PATHS["SNAPSHOTS"], file_name)
-        
-        with open(full_path, 'w', encoding='utf-8') as f:
-            json.dump(certificate, f, indent=4)
-
-        print(f"\n[+] SEALING COMPLETE: {final_hash}")
-        print(f"[+] ARTIFACT SAVED : {file_name}")
+        publish_vault(vault, start_block, current_head)
+        vault.discard()
+        if BATCH_FALLBACKS:
+            print(f"[*] BATCH FALLBACKS: {BATCH_FALLBACKS}")
 
+    except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+        invalidate_provider()
+        print(f"\n[ERROR] Gateway connection lost: {str(e)}")
     except Exception as e:
         print(f"\n[ERROR] System Integrity Breach: {str(e)}")
+    finally:
+        # An unsealed spool stays on disk and is resumed by the next cycle
+        if vault is not None:
+            vault.spool.close()
+
+def run_notary_daemon():
+    """
+    Long-running mode: repeats the notary cycle, keeping the gateway connection,
+    session pool and pending IPFS jobs alive between cycles.
+    """
+    try:
+        while True:
+            try:
+                run_notary_cycle()
+            except GatewayUnavailable as e:
+                # An outage of every gateway is a failed cycle, not a reason to exit
+                print(f"\n[WARN] {str(e)} Retrying in {CYCLE_INTERVAL}s.", flush=True)
+            time.sleep(CYCLE_INTERVAL)
+    except KeyboardInterrupt:
+        print("\n[*] Notary daemon stopped. Flushing state.")
+
+# --- [ LIVE MODE ] ---
+def split_whole_blocks(buffer):
+    """
+    Splits buffered pushes into the blocks that are complete (a later block has
+    already arrived) and the newest block, whose logs may still be streaming in.
+    Returns (sealable, held).
+    """
+    newest = max(entry["blockNumber"] for entry in buffer)
+    sealable = [entry for entry in buffer if entry["blockNumber"] < newest]
+    held = [entry for entry in buffer if entry["blockNumber"] == newest]
+    return sealable, held
+
+def retract_live_entry(buffer, notice):
+    """
+    Applies a reorg notice (a push with removed: true) by dropping the log it
+    retracts from the buffer. Returns whether that log was still unsealed.
+    """
+    def identity(entry):
+        return entry.get("blockHash"), entry.get("transactionHash"), entry["logIndex"]
+
+    retracted = identity(notice)
+    kept = [entry for entry in buffer if identity(entry) != retracted]
+    found = len(kept) != len(buffer)
+    buffer[:] = kept
+    return found
+
+def seal_live_buffer(buffer):
+    """
+    Seals buffered subscription logs and moves the cursor past the newest block,
+    so a restart's catch-up scan resumes after them.
+    """
+    entries = canonical_order(buffer)
+    vault = ArtifactVault()
+    for entry in entries:
+        vault.add(entry)
+
+    first_block, last_block = entries[0]["blockNumber"], entries[-1]["blockNumber"]
+    publish_vault(vault, first_block, last_block)
+    advance_cursor(max(last_block + 1, read_cursor()))
+    flush_cursor()
+
+async def pump_subscription(w3, queue):
+    """
+    Moves pushed logs from the socket into a queue, so the sealing timer can
+    wait on the queue without ever cancelling the socket reader.
+    """
+    async for message in w3.socket.process_subscriptions():
+        await queue.put(logs_to_dicts([message["result"]])[0])
+
+async def follow_live_logs(url):
+    """
+    Subscribes to target logs on one WebSocket gateway and seals them every
+    LIVE_SEAL_EVERY logs or LIVE_SEAL_INTERVAL seconds (hybrid batching),
+    always in whole blocks.
+    """
+    from web3 import AsyncWeb3, WebSocketProvider
+
+    async with AsyncWeb3(WebSocketProvider(url)) as w3:
+        await w3.eth.subscribe("logs", {"address": list(CHECKSUM_TARGETS)})
+        subscribed_head = await w3.eth.block_number
+        print(f"[+] LIVE FEED      : {url} (from block {subscribed_head})", flush=True)
+
+        # The pump drains the socket into an unbounded queue from the start, so
+        # web3's bounded subscription queue never stalls the listener while
+        # the catch-up runs.
+        queue = asyncio.Queue()
+        pump = asyncio.create_task(pump_subscription(w3, queue))
+        try:
+            # Cold-start catch-up runs after subscribing; logs mined meanwhile
+            # wait in the queue, and anything the ranged scan sealed is skipped.
+            await asyncio.to_thread(run_notary_cycle)
+            floor = read_cursor()
+            if floor <= subscribed_head:
+                raise ConnectionError(f"catch-up stopped at {floor}, feed starts after {subscribed_head}")
+
+            buffer = []  # Unsealed pushes; the newest block is always held back
+            deadline = time.monotonic() + LIVE_SEAL_INTERVAL
+            while True:
+                try:
+                    entry = await asyncio.wait_for(queue.get(), timeout=max(0, deadline - time.monotonic()))
+                    if entry.get("removed"):
+                        # Reorg notices are never sealed; they cancel the log they name
+                        if not retract_live_entry(buffer, entry) and entry["blockNumber"] >= floor:
+                            print(f"[WARN] Reorg retracted an already sealed log: "
+                                  f"{entry.get('transactionHash')}#{entry['logIndex']}", flush=True)
+                    elif entry["blockNumber"] >= floor:
+                        buffer.append(entry)
+                except asyncio.TimeoutError:
+                    pass
+
+                if pump.done():
+                    pump.result()
+                    raise ConnectionError("subscription stream closed")
+
+                if len(buffer) >= LIVE_SEAL_EVERY or time.monotonic() >= deadline:
+                    # Only whole blocks are sealed: the cursor then never passes
+                    # a block whose remaining logs have not been pushed yet.
+                    if buffer:
+                        sealable, buffer = split_whole_blocks(buffer)
+                        if sealable:
+                            await asyncio.to_thread(seal_live_buffer, sealable)
+                    IPFS_DISPATCHER.reap()
+                    deadline = time.monotonic() + LIVE_SEAL_INTERVAL
+        finally:
+            pump.cancel()
+
+async def run_live_notary():
+    """
+    Real-time mode: follows eth_subscribe("logs") pushes instead of polling,
+    failing over between WS_NODES. Unsealed logs are never lost on a drop:
+    the cursor has not passed them, so the next catch-up scan re-collects them.
+    """
+    initialize_industrial_structure()
+    while True:
+        for url in WS_NODES:
+            try:
+                await follow_live_logs(url)
+            except Exception as e:
+                print(f"[WARN] Live feed {url} interrupted: {str(e)}", flush=True)
+        await asyncio.sleep(CYCLE_INTERVAL)
 
 if __name__ == "__main__":
-    run_notary_cycle()
+    parser = argparse.ArgumentParser(description="AOXC Supreme Notary")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--daemon", action="store_true", help=f"run a notary cycle every {CYCLE_INTERVAL}s")
+    mode.add_argument("--live", action="store_true", help="catch up, then notarize pushed logs over WebSocket")
+    args = parser.parse_args()
+
+    if args.live:
+        try:
+            asyncio.run(run_live_notary())
+        except KeyboardInterrupt:
+            print("\n[*] Live notary stopped. Flushing state.")
+    elif args.daemon:
+        run_notary_daemon()
+    else:
+        try:
+            run_notary_cycle()
+        except GatewayUnavailable as e:
+            sys.exit(f"\n[!] CRITICAL: {str(e)}")